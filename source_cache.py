@@ -14,6 +14,9 @@ import requests
 
 import db
 
+# Guards every db call made here. Scraping threads (main.GAME_FETCH_WORKERS x
+# SOURCE_FETCH_WORKERS) outnumber db.py's connection pool, which raises
+# PoolError instead of waiting once it is empty.
 _LOCK = threading.Lock()
 
 SOURCE_TTLS = {
@@ -25,6 +28,17 @@ SOURCE_TTLS = {
     "default": 60 * 15,
 }
 
+# Minimum seconds between two network fetches to the same source, shared by
+# all scraping threads. Cache hits never wait.
+SOURCE_MIN_INTERVALS = {
+    "steamcharts": 2,
+    "steam_api": 1,
+    "steam_news": 2,
+    "reddit": 1,
+    "google_news": 2,
+    "default": 1,
+}
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -38,6 +52,31 @@ def _content_hash(body: str) -> str:
     return hashlib.sha256(body.encode("utf-8")).hexdigest()
 
 
+class _SourceThrottle:
+    """Space out network fetches per source across threads.
+
+    Callers reserve the next free slot for a source under the lock, then sleep
+    outside it until that slot arrives, so one slow source never blocks another.
+    """
+
+    def __init__(self, intervals: dict[str, float]):
+        self._intervals = intervals
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, source: str) -> None:
+        interval = self._intervals.get(source, self._intervals["default"])
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(source, now))
+            self._next_slot[source] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_THROTTLE = _SourceThrottle(SOURCE_MIN_INTERVALS)
+
+
 def _build_response(url: str, status_code: int, headers_json: str, body: str) -> requests.Response:
     response = requests.Response()
     response.status_code = status_code
@@ -70,14 +109,16 @@ def cached_get(
             db.record_fetch_run(source, url, True, row[0], row[3])
             return _build_response(url, row[0], row[1], row[2])
 
-    # Cache miss — fetch from source (outside the lock)
+    # Cache miss — wait for this source's turn, then fetch (outside the lock)
+    _THROTTLE.wait(source)
     try:
         response = fetcher()
     except requests.RequestException as exc:
         status_code = 0
         if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
             status_code = exc.response.status_code
-        db.record_fetch_run(source, url, False, status_code, None)
+        with _LOCK:
+            db.record_fetch_run(source, url, False, status_code, None)
         raise
     body = response.text
     headers_json = json.dumps(dict(response.headers))
@@ -94,6 +135,5 @@ def cached_get(
             content_hash=content_hash,
             fetched_at=now,
         )
-
-    db.record_fetch_run(source, url, False, response.status_code, content_hash)
+        db.record_fetch_run(source, url, False, response.status_code, content_hash)
     return response